@@ -0,0 +1,400 @@
+# Generated by Django 5.2.18 on 2026-10-17 04:16
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('generator', '0002_apkbuild'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GenerationRule',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('rule_type', models.CharField(choices=[('import', 'Import Rule'), ('property', 'Property Rule'), ('wrapper', 'Wrapper Rule'), ('validation', 'Validation Rule'), ('transform', 'Transform Rule')], max_length=20)),
+                ('name', models.CharField(max_length=100)),
+                ('condition', models.JSONField(default=dict, help_text='When to apply this rule')),
+                ('action', models.JSONField(default=dict, help_text='What action to take')),
+                ('priority', models.IntegerField(default=0)),
+                ('is_active', models.BooleanField(default=True)),
+            ],
+            options={
+                'ordering': ['-priority', 'name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='PropertyTransformer',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('property_type', models.CharField(help_text='matches WidgetProperty.property_type', max_length=50)),
+                ('transformer_name', models.CharField(max_length=100)),
+                ('transformer_code', models.TextField(help_text='Python code or template')),
+                ('priority', models.IntegerField(default=0)),
+                ('is_active', models.BooleanField(default=True)),
+                ('description', models.TextField(blank=True)),
+            ],
+            options={
+                'ordering': ['-priority', 'transformer_name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='APIConfiguration',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('base_url', models.URLField()),
+                ('timeout', models.IntegerField(default=30)),
+                ('retry_count', models.IntegerField(default=3)),
+                ('default_headers', models.JSONField(default=dict)),
+                ('project', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, to='generator.flutterproject')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='AppConfiguration',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('app_type', models.CharField(choices=[('ecommerce', 'E-commerce'), ('social', 'Social Media'), ('business', 'Business'), ('education', 'Education'), ('health', 'Healthcare'), ('finance', 'Finance'), ('news', 'News'), ('entertainment', 'Entertainment'), ('productivity', 'Productivity'), ('custom', 'Custom')], max_length=50)),
+                ('state_management', models.CharField(choices=[('provider', 'Provider'), ('riverpod', 'Riverpod'), ('getx', 'GetX'), ('bloc', 'BLoC'), ('mobx', 'MobX')], default='provider', max_length=50)),
+                ('navigation_type', models.CharField(choices=[('drawer', 'Navigation Drawer'), ('bottom_nav', 'Bottom Navigation'), ('tab_bar', 'Tab Bar'), ('custom', 'Custom Navigation')], default='drawer', max_length=50)),
+                ('primary_color', models.CharField(default='#2196F3', max_length=7)),
+                ('secondary_color', models.CharField(default='#FF4081', max_length=7)),
+                ('dark_mode_enabled', models.BooleanField(default=True)),
+                ('font_family', models.CharField(default='Roboto', max_length=100)),
+                ('uses_authentication', models.BooleanField(default=False)),
+                ('uses_api', models.BooleanField(default=False)),
+                ('uses_local_storage', models.BooleanField(default=False)),
+                ('uses_push_notifications', models.BooleanField(default=False)),
+                ('uses_maps', models.BooleanField(default=False)),
+                ('uses_camera', models.BooleanField(default=False)),
+                ('uses_payments', models.BooleanField(default=False)),
+                ('uses_social_login', models.BooleanField(default=False)),
+                ('uses_analytics', models.BooleanField(default=False)),
+                ('uses_ads', models.BooleanField(default=False)),
+                ('supported_languages', models.JSONField(default=list)),
+                ('default_language', models.CharField(default='en', max_length=5)),
+                ('project', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, to='generator.flutterproject')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='AppRoute',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('route_name', models.CharField(max_length=100, unique=True)),
+                ('route_path', models.CharField(max_length=200)),
+                ('page_name', models.CharField(max_length=100)),
+                ('is_protected', models.BooleanField(default=False)),
+                ('is_initial', models.BooleanField(default=False)),
+                ('transition_type', models.CharField(choices=[('material', 'Material'), ('cupertino', 'Cupertino'), ('fade', 'Fade'), ('slide', 'Slide'), ('scale', 'Scale')], default='material', max_length=50)),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='routes', to='generator.flutterproject')),
+            ],
+            options={
+                'unique_together': {('project', 'route_name')},
+            },
+        ),
+        migrations.CreateModel(
+            name='AppState',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('variable_name', models.CharField(max_length=100)),
+                ('variable_type', models.CharField(choices=[('string', 'String'), ('int', 'Integer'), ('double', 'Double'), ('bool', 'Boolean'), ('list', 'List'), ('map', 'Map/Object'), ('custom', 'Custom Class')], max_length=50)),
+                ('initial_value', models.JSONField(default=dict)),
+                ('is_persistent', models.BooleanField(default=False)),
+                ('is_observable', models.BooleanField(default=True)),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='states', to='generator.flutterproject')),
+            ],
+            options={
+                'unique_together': {('project', 'variable_name')},
+            },
+        ),
+        migrations.CreateModel(
+            name='APIEndpoint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('endpoint_name', models.CharField(max_length=100)),
+                ('endpoint_path', models.CharField(max_length=200)),
+                ('method', models.CharField(choices=[('GET', 'GET'), ('POST', 'POST'), ('PUT', 'PUT'), ('DELETE', 'DELETE'), ('PATCH', 'PATCH')], max_length=10)),
+                ('headers', models.JSONField(blank=True, default=dict)),
+                ('requires_auth', models.BooleanField(default=False)),
+                ('request_body_template', models.JSONField(blank=True, null=True)),
+                ('query_parameters', models.JSONField(blank=True, default=list)),
+                ('response_type', models.CharField(default='json', max_length=50)),
+                ('error_message', models.CharField(default='An error occurred', max_length=200)),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='api_endpoints', to='generator.flutterproject')),
+                ('success_state_update', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='api_updates', to='generator.appstate')),
+            ],
+            options={
+                'unique_together': {('project', 'endpoint_name')},
+            },
+        ),
+        migrations.CreateModel(
+            name='CustomFunction',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('function_name', models.CharField(max_length=100)),
+                ('parameters', models.JSONField(default=list)),
+                ('return_type', models.CharField(default='void', max_length=50)),
+                ('function_body', models.TextField()),
+                ('is_async', models.BooleanField(default=False)),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='custom_functions', to='generator.flutterproject')),
+            ],
+            options={
+                'unique_together': {('project', 'function_name')},
+            },
+        ),
+        migrations.CreateModel(
+            name='DataModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('model_name', models.CharField(max_length=100)),
+                ('fields', models.JSONField(default=list)),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='data_models', to='generator.flutterproject')),
+            ],
+            options={
+                'unique_together': {('project', 'model_name')},
+            },
+        ),
+        migrations.CreateModel(
+            name='AuthConfiguration',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('auth_type', models.CharField(choices=[('jwt', 'JWT Token'), ('firebase', 'Firebase Auth'), ('oauth', 'OAuth 2.0'), ('basic', 'Basic Auth'), ('custom', 'Custom Auth')], max_length=50)),
+                ('token_storage_key', models.CharField(default='auth_token', max_length=100)),
+                ('user_storage_key', models.CharField(default='user_data', max_length=100)),
+                ('login_endpoint', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='login_endpoint', to='generator.apiendpoint')),
+                ('logout_endpoint', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='logout_endpoint', to='generator.apiendpoint')),
+                ('project', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, to='generator.flutterproject')),
+                ('refresh_endpoint', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='refresh_endpoint', to='generator.apiendpoint')),
+                ('register_endpoint', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='register_endpoint', to='generator.apiendpoint')),
+                ('user_model', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='generator.datamodel')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='DynamicPageComponent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('page_name', models.CharField(default='HomePage', max_length=100)),
+                ('properties', models.JSONField(default=dict)),
+                ('order', models.IntegerField(default=0)),
+                ('parent_component', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='generator.dynamicpagecomponent')),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='dynamic_components', to='generator.flutterproject')),
+            ],
+            options={
+                'ordering': ['order'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ConditionalWidget',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('condition_type', models.CharField(choices=[('state_equals', 'State Equals'), ('state_not_equals', 'State Not Equals'), ('state_greater', 'State Greater Than'), ('state_less', 'State Less Than'), ('state_contains', 'State Contains'), ('is_authenticated', 'Is Authenticated'), ('is_not_authenticated', 'Is Not Authenticated'), ('platform_is', 'Platform Is')], max_length=50)),
+                ('condition_value', models.JSONField(blank=True, null=True)),
+                ('show_widget', models.JSONField(default=dict)),
+                ('hide_widget', models.JSONField(blank=True, null=True)),
+                ('state_variable', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='generator.appstate')),
+                ('component', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='conditional_rendering', to='generator.dynamicpagecomponent')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='EventHandler',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('event_type', models.CharField(choices=[('onTap', 'On Tap'), ('onPressed', 'On Pressed'), ('onLongPress', 'On Long Press'), ('onChanged', 'On Changed'), ('onSubmit', 'On Submit'), ('onInit', 'On Init'), ('onDispose', 'On Dispose')], max_length=50)),
+                ('action_type', models.CharField(choices=[('navigate', 'Navigate'), ('navigate_back', 'Navigate Back'), ('api_call', 'API Call'), ('update_state', 'Update State'), ('show_dialog', 'Show Dialog'), ('show_snackbar', 'Show Snackbar'), ('custom_function', 'Custom Function'), ('submit_form', 'Submit Form')], max_length=50)),
+                ('action_parameters', models.JSONField(blank=True, default=dict)),
+                ('component', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='event_handlers', to='generator.dynamicpagecomponent')),
+                ('target_api', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='generator.apiendpoint')),
+                ('target_function', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='generator.customfunction')),
+                ('target_route', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='generator.approute')),
+                ('target_state', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='generator.appstate')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='FormConfiguration',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('form_name', models.CharField(max_length=100)),
+                ('page_name', models.CharField(max_length=100)),
+                ('success_action', models.CharField(default='show_success', max_length=100)),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='forms', to='generator.flutterproject')),
+                ('submit_endpoint', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='generator.apiendpoint')),
+                ('success_route', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='generator.approute')),
+            ],
+            options={
+                'unique_together': {('project', 'form_name')},
+            },
+        ),
+        migrations.CreateModel(
+            name='FormField',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('field_name', models.CharField(max_length=100)),
+                ('field_type', models.CharField(choices=[('text', 'Text Input'), ('email', 'Email Input'), ('password', 'Password Input'), ('number', 'Number Input'), ('phone', 'Phone Input'), ('multiline', 'Multiline Text'), ('dropdown', 'Dropdown'), ('checkbox', 'Checkbox'), ('radio', 'Radio Button'), ('date', 'Date Picker'), ('time', 'Time Picker'), ('file', 'File Upload')], max_length=50)),
+                ('label', models.CharField(max_length=100)),
+                ('placeholder', models.CharField(blank=True, max_length=200)),
+                ('initial_value', models.CharField(blank=True, max_length=200)),
+                ('is_required', models.BooleanField(default=False)),
+                ('min_length', models.IntegerField(blank=True, null=True)),
+                ('max_length', models.IntegerField(blank=True, null=True)),
+                ('regex_pattern', models.CharField(blank=True, max_length=200)),
+                ('error_message', models.CharField(default='Invalid input', max_length=200)),
+                ('options', models.JSONField(blank=True, default=list)),
+                ('order', models.IntegerField(default=0)),
+                ('bind_to_state', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='generator.appstate')),
+                ('form', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='fields', to='generator.formconfiguration')),
+            ],
+            options={
+                'ordering': ['order'],
+            },
+        ),
+        migrations.CreateModel(
+            name='NavigationItem',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('label', models.CharField(max_length=50)),
+                ('icon', models.CharField(max_length=100)),
+                ('order', models.IntegerField(default=0)),
+                ('is_active', models.BooleanField(default=True)),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='nav_items', to='generator.flutterproject')),
+                ('route', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='generator.approute')),
+            ],
+            options={
+                'ordering': ['order'],
+            },
+        ),
+        migrations.CreateModel(
+            name='StateAction',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('action_name', models.CharField(max_length=100)),
+                ('action_type', models.CharField(choices=[('set', 'Set Value'), ('increment', 'Increment'), ('decrement', 'Decrement'), ('toggle', 'Toggle Boolean'), ('add_to_list', 'Add to List'), ('remove_from_list', 'Remove from List'), ('update_map', 'Update Map'), ('api_response', 'From API Response')], max_length=50)),
+                ('action_value', models.JSONField(blank=True, null=True)),
+                ('state', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='actions', to='generator.appstate')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='WidgetType',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(help_text='e.g., CarouselSlider, TextField', max_length=100, unique=True)),
+                ('dart_class_name', models.CharField(help_text='Actual Dart class name', max_length=100)),
+                ('category', models.CharField(choices=[('layout', 'Layout'), ('input', 'Input'), ('display', 'Display'), ('media', 'Media'), ('navigation', 'Navigation'), ('container', 'Container'), ('animation', 'Animation'), ('custom', 'Custom')], default='custom', max_length=50)),
+                ('is_container', models.BooleanField(default=False, help_text='Can contain child widgets')),
+                ('can_have_multiple_children', models.BooleanField(default=False)),
+                ('import_path', models.CharField(blank=True, help_text='Override default import path', max_length=255)),
+                ('documentation', models.TextField(blank=True)),
+                ('example_code', models.TextField(blank=True)),
+                ('min_flutter_version', models.CharField(blank=True, max_length=20)),
+                ('is_active', models.BooleanField(default=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('package', models.ForeignKey(blank=True, help_text='Package that provides this widget', null=True, on_delete=django.db.models.deletion.CASCADE, to='generator.pubdevpackage')),
+            ],
+            options={
+                'ordering': ['category', 'name'],
+                'unique_together': {('name', 'package')},
+            },
+        ),
+        migrations.CreateModel(
+            name='WidgetPattern',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True)),
+                ('description', models.TextField()),
+                ('pattern_template', models.TextField(help_text='Template for this pattern')),
+                ('example_properties', models.JSONField(default=dict)),
+                ('category', models.CharField(max_length=50)),
+                ('widget_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='generator.widgettype')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='PackageWidgetRegistry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('auto_discovered', models.BooleanField(default=False)),
+                ('discovery_data', models.JSONField(default=dict, help_text='Metadata from discovery')),
+                ('last_analyzed', models.DateTimeField(auto_now=True)),
+                ('package', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='generator.pubdevpackage')),
+                ('widget_types', models.ManyToManyField(to='generator.widgettype')),
+            ],
+        ),
+        migrations.AddField(
+            model_name='dynamicpagecomponent',
+            name='widget_type',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='generator.widgettype'),
+        ),
+        migrations.CreateModel(
+            name='DynamicListConfiguration',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('data_source', models.CharField(choices=[('api', 'API Endpoint'), ('state', 'App State'), ('firebase', 'Firebase'), ('static', 'Static Data')], max_length=20)),
+                ('static_data', models.JSONField(blank=True, default=list)),
+                ('item_properties_mapping', models.JSONField(default=dict)),
+                ('loading_widget', models.JSONField(default=dict)),
+                ('empty_widget', models.JSONField(default=dict)),
+                ('error_widget', models.JSONField(default=dict)),
+                ('enable_pull_refresh', models.BooleanField(default=True)),
+                ('enable_pagination', models.BooleanField(default=False)),
+                ('items_per_page', models.IntegerField(default=20)),
+                ('api_endpoint', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='generator.apiendpoint')),
+                ('state_variable', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='generator.appstate')),
+                ('component', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, to='generator.dynamicpagecomponent')),
+                ('item_widget_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='generator.widgettype')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='LocalStorage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key_name', models.CharField(max_length=100)),
+                ('data_type', models.CharField(choices=[('string', 'String'), ('int', 'Integer'), ('double', 'Double'), ('bool', 'Boolean'), ('stringList', 'String List')], max_length=50)),
+                ('default_value', models.JSONField(blank=True, null=True)),
+                ('description', models.CharField(blank=True, max_length=200)),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='storage_keys', to='generator.flutterproject')),
+            ],
+            options={
+                'unique_together': {('project', 'key_name')},
+            },
+        ),
+        migrations.CreateModel(
+            name='WidgetTemplate',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('template_name', models.CharField(default='default', max_length=100)),
+                ('template_code', models.TextField(help_text='Django template syntax')),
+                ('is_active', models.BooleanField(default=True)),
+                ('priority', models.IntegerField(default=0, help_text='Higher priority templates are used first')),
+                ('conditions', models.JSONField(blank=True, default=dict, help_text='When to use this template')),
+                ('description', models.TextField(blank=True)),
+                ('widget_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='templates', to='generator.widgettype')),
+            ],
+            options={
+                'ordering': ['-priority', 'template_name'],
+                'unique_together': {('widget_type', 'template_name')},
+            },
+        ),
+        migrations.CreateModel(
+            name='WidgetProperty',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(help_text='Property name in Dart', max_length=100)),
+                ('property_type', models.CharField(choices=[('string', 'String'), ('int', 'Integer'), ('double', 'Double'), ('bool', 'Boolean'), ('color', 'Color'), ('enum', 'Enum'), ('widget', 'Widget'), ('widget_list', 'Widget List'), ('map', 'Map/Object'), ('duration', 'Duration'), ('edge_insets', 'EdgeInsets'), ('alignment', 'Alignment'), ('text_style', 'TextStyle'), ('decoration', 'Decoration'), ('gradient', 'Gradient'), ('shadow', 'Shadow'), ('border', 'Border'), ('custom', 'Custom Type')], max_length=50)),
+                ('dart_type', models.CharField(help_text='Exact Dart type signature', max_length=200)),
+                ('is_required', models.BooleanField(default=False)),
+                ('is_positional', models.BooleanField(default=False, help_text='Positional vs named parameter')),
+                ('position', models.IntegerField(default=0, help_text='Order for positional parameters')),
+                ('default_value', models.TextField(blank=True)),
+                ('allowed_values', models.JSONField(blank=True, default=dict, help_text='For enums/constraints')),
+                ('validation_rules', models.JSONField(blank=True, default=dict)),
+                ('documentation', models.TextField(blank=True)),
+                ('example_value', models.TextField(blank=True)),
+                ('widget_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='properties', to='generator.widgettype')),
+            ],
+            options={
+                'ordering': ['position', 'name'],
+                'unique_together': {('widget_type', 'name')},
+            },
+        ),
+    ]
@@ -2,22 +2,29 @@
 # FIXED VERSION - Better enum handling and validation
 
 from abc import ABC, abstractmethod
+import html
 import json
 import re
 from typing import Any, Optional, Dict
 
+# Separators ignored when matching colour/alignment names ("deep_purple", "top-left")
+_NAME_SEPARATORS = str.maketrans('', '', '_- ')
+
+def unescape_until_stable(value: str) -> str:
+    """Decode HTML entities repeatedly until nested encodings are gone"""
+    if '&' not in value:
+        return value
+    decoded = html.unescape(value)
+    while '&' in decoded and decoded != value:
+        value = decoded
+        decoded = html.unescape(decoded)
+    return decoded
+
 def decode_html_entities(value):
     """Recursively decode HTML entities in strings, dicts, and lists"""
-    import html
     if isinstance(value, str):
         # Decode multiple times to handle multiple levels of encoding
-        decoded = value
-        for _ in range(3):  # Decode up to 3 levels deep
-            prev = decoded
-            decoded = html.unescape(decoded)
-            if decoded == prev:
-                break
-        return decoded
+        return unescape_until_stable(value)
     elif isinstance(value, dict):
         return {decode_html_entities(k): decode_html_entities(v) for k, v in value.items()}
     elif isinstance(value, list):
@@ -49,11 +56,10 @@ class StringPropertyHandler(PropertyHandler):
             return "{}"
 
         if isinstance(value, dict):
-            import html
             items = []
             for k, v in value.items():
                 # Decode HTML entities in keys
-                clean_key = html.unescape(str(k)) if isinstance(k, str) else k
+                clean_key = unescape_until_stable(k) if isinstance(k, str) else k
                 key = f"'{clean_key}'"
 
     def validate(self, value):
@@ -123,7 +129,7 @@ class ColorPropertyHandler(PropertyHandler):
                 return value
 
             # Check color map
-            color_lower = value.lower().replace('_', '').replace('-', '').replace(' ', '')
+            color_lower = value.lower().translate(_NAME_SEPARATORS)
             if color_lower in self.COLOR_MAP:
                 return self.COLOR_MAP[color_lower]
 
@@ -274,14 +280,9 @@ class EdgeInsetsPropertyHandler(PropertyHandler):
             return "null"
 
         # Decode deeply first
-        import html
         if isinstance(value, str):
             # Multiple decode passes
-            for _ in range(5):
-                prev = value
-                value = html.unescape(value)
-                if value == prev:
-                    break
+            value = unescape_until_stable(value)
 
         # Handle different input formats
         if isinstance(value, dict):
@@ -291,11 +292,7 @@ class EdgeInsetsPropertyHandler(PropertyHandler):
                 # Decode key
                 clean_key = k
                 if isinstance(k, str):
-                    for _ in range(5):
-                        prev = clean_key
-                        clean_key = html.unescape(clean_key)
-                        if clean_key == prev:
-                            break
+                    clean_key = unescape_until_stable(clean_key)
                 clean_dict[clean_key] = v
 
             if 'all' in clean_dict:
@@ -371,7 +368,7 @@ class AlignmentPropertyHandler(PropertyHandler):
                 return value
 
             # Check map
-            value_lower = value.lower().replace('_', '').replace('-', '').replace(' ', '')
+            value_lower = value.lower().translate(_NAME_SEPARATORS)
             if value_lower in self.ALIGNMENT_MAP:
                 return self.ALIGNMENT_MAP[value_lower]
 
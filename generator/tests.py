@@ -1,3 +1,240 @@
-from django.test import TestCase
+import datetime
+import random
+import re
+from decimal import Decimal
+from unittest import mock
 
-# Create your tests here.
+from django.db import OperationalError
+from django.template import Context, Template
+from django.test import SimpleTestCase, TestCase, TransactionTestCase, override_settings
+
+from .models import WidgetType
+from .widget_generator import (
+    DynamicWidgetGenerator,
+    ProcessedProp,
+    _STRAY_COMMA_RE,
+    _compile_render_function,
+    _replace_none_words,
+)
+
+
+class RenderFunctionCompilerTests(SimpleTestCase):
+    """Compiled widget templates must render exactly like Django does"""
+
+    widget_name = 'Card'
+    properties = [
+        ProcessedProp('color', 'Colors.red', 'color', False),
+        ProcessedProp('elevation', '2.0', 'double', False),
+    ]
+    children = ["Text('a')", "Text('b')"]
+
+    def assertRendersLikeDjango(self, template_code, widget_type=None, properties=None, children=None):
+        properties = self.properties if properties is None else properties
+        children = self.children if children is None else children
+
+        render = _compile_render_function(template_code)
+        self.assertIsNotNone(render, 'template should be compiled')
+
+        expected = Template(template_code).render(Context({
+            'widget_name': self.widget_name,
+            'properties': properties,
+            'children': children,
+            'widget_type': widget_type,
+        }, autoescape=False))
+        self.assertEqual(render(self.widget_name, properties, children, widget_type), expected)
+
+    def test_text_and_variables(self):
+        self.assertRendersLikeDjango('{{ widget_name }}(child: {{ children.0 }})')
+
+    def test_children_index(self):
+        self.assertRendersLikeDjango('{{ children.0 }}|{{ children.1 }}|{{ children.5 }}')
+
+    def test_for_loop(self):
+        self.assertRendersLikeDjango(
+            '{{ widget_name }}({% for prop in properties %}{{ prop.name }}: {{ prop.value }}, {% endfor %})'
+        )
+
+    def test_for_empty(self):
+        template_code = 'Column(children: [{% for child in children %}{{ child }},{% empty %}SizedBox(){% endfor %}])'
+        self.assertRendersLikeDjango(template_code)
+        self.assertRendersLikeDjango(template_code, children=[])
+
+    def test_if_elif_else(self):
+        template_code = (
+            '{% if not children %}none{% elif properties.0.name == "color" %}coloured{% else %}plain{% endif %}'
+        )
+        self.assertRendersLikeDjango(template_code)
+        self.assertRendersLikeDjango(template_code, properties=[])
+        self.assertRendersLikeDjango(template_code, children=[])
+
+    def test_in_and_not_in(self):
+        template_code = (
+            '{% if "Text(\'a\')" in children %}a{% endif %}'
+            '{% if "Text(\'z\')" not in children %}!z{% endif %}'
+            '{% if widget_name in missing %}never{% endif %}'
+        )
+        self.assertRendersLikeDjango(template_code)
+
+    def test_missing_names(self):
+        self.assertRendersLikeDjango('[{{ missing }}][{{ missing.attr }}][{{ widget_name.nope }}]')
+        self.assertRendersLikeDjango('{% if missing %}yes{% else %}no{% endif %}')
+        self.assertRendersLikeDjango('{% for x in missing %}{{ x }}{% empty %}empty{% endfor %}')
+
+    @override_settings(USE_TZ=True, TIME_ZONE='Asia/Amman')
+    def test_values_are_localized(self):
+        widget_type = WidgetType(name='Clock', dart_class_name='Clock',
+                                 created_at=datetime.datetime(2024, 1, 2, 22, 30, tzinfo=datetime.timezone.utc))
+        properties = [
+            ProcessedProp('ratio', Decimal('1.50'), 'double', False),
+            ProcessedProp('scale', 0.5, 'double', False),
+        ]
+        self.assertRendersLikeDjango(
+            '{{ widget_type.created_at }}|{% for prop in properties %}{{ prop.value }};{% endfor %}',
+            widget_type=widget_type, properties=properties,
+        )
+
+    def test_unsupported_templates_fall_back_to_django(self):
+        self.assertIsNone(_compile_render_function('{{ widget_name|lower }}'))
+        self.assertIsNone(_compile_render_function('{% for c in children %}{{ forloop.counter }}{% endfor %}'))
+
+    def test_compiled_functions_are_shared(self):
+        template_code = '{{ widget_name }}()'
+        self.assertIs(_compile_render_function(template_code), _compile_render_function(template_code))
+
+
+class RenderFunctionAltersDataTests(TestCase):
+
+    def test_alters_data_methods_are_not_called(self):
+        widget_type = WidgetType.objects.create(name='Danger', dart_class_name='Danger')
+        template_code = 'Danger(x: {{ widget_type.delete }})'
+
+        rendered = _compile_render_function(template_code)('Danger', [], [], widget_type)
+
+        self.assertEqual(rendered, Template(template_code).render(Context({'widget_type': widget_type})))
+        self.assertEqual(rendered, 'Danger(x: )')
+        self.assertTrue(WidgetType.objects.filter(name='Danger').exists())
+
+
+class WidgetTypeLookupTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        WidgetType.objects.create(name='Column', dart_class_name='Column',
+                                  is_container=True, can_have_multiple_children=True)
+        WidgetType.objects.create(name='Text', dart_class_name='Text')
+        WidgetType.objects.create(name='Badge', dart_class_name='Badge')
+
+    def test_missing_widget_types_are_looked_up_once(self):
+        tree = {'type': 'Column', 'children': [
+            {'type': 'Badge', 'properties': {
+                'child': {'type': 'MyIcon%d' % i, 'properties': {'shape': {'type': 'linear'}}},
+                'badgeContent': {'type': 'Text', 'properties': {'data': str(i)}},
+            }}
+            for i in range(20)
+        ]}
+        generator = DynamicWidgetGenerator()
+
+        # One widget type query plus its two prefetches, for the whole tree
+        with self.assertNumQueries(3):
+            code = generator.generate_widget(tree)
+
+        self.assertIn('MyIcon19()', code)
+        self.assertIn('linear', generator.missing_widget_types)
+        with self.assertNumQueries(0):
+            generator.generate_widget({'type': 'MyIcon0'})
+
+    def test_database_errors_fall_back(self):
+        failing = mock.Mock(**{
+            'filter.side_effect': OperationalError('database is locked'),
+            'prefetch_related.side_effect': OperationalError('database is locked'),
+        })
+        with mock.patch.object(WidgetType, 'objects', failing):
+            code = DynamicWidgetGenerator().generate_widget({'type': 'Column', 'children': []})
+
+        self.assertEqual(code, 'Column()')
+
+
+@mock.patch('generator.widget_generator._GIL_DISABLED', True)
+class ParallelChildrenTests(TransactionTestCase):
+    """The thread pool path only runs on free-threaded builds, so force it.
+
+    Worker threads open (and close) their own connections, so the rows must
+    be committed rather than held in a test transaction.
+    """
+
+    def setUp(self):
+        WidgetType.objects.create(name='Column', dart_class_name='Column',
+                                  is_container=True, can_have_multiple_children=True)
+        WidgetType.objects.create(name='Text', dart_class_name='Text')
+
+    def column(self, children):
+        return {'type': 'Column', 'children': children}
+
+    def test_parallel_matches_sequential(self):
+        tree = self.column([{'type': 'Text', 'properties': {'data': 'item %d' % i}} for i in range(12)])
+
+        generator = DynamicWidgetGenerator()
+        with mock.patch.object(generator, '_generate_children_parallel',
+                               wraps=generator._generate_children_parallel) as parallel:
+            code = generator.generate_widget(tree)
+        self.assertTrue(parallel.called)
+
+        with mock.patch('generator.widget_generator._GIL_DISABLED', False):
+            self.assertEqual(code, DynamicWidgetGenerator().generate_widget(tree))
+
+    def test_unhashable_child_type_falls_back(self):
+        children = [{'type': 'Text', 'properties': {'data': 'item %d' % i}} for i in range(12)]
+        children.append({'type': {'name': 'Text'}})
+
+        code = DynamicWidgetGenerator().generate_widget(self.column(children))
+
+        self.assertIn("Text('item 11')", code)
+
+
+class StrayCommaTests(SimpleTestCase):
+
+    def strip(self, code):
+        return _STRAY_COMMA_RE.sub('', code)
+
+    def test_double_and_trailing_commas(self):
+        self.assertEqual(self.strip('foo(a,,b,)'), 'foo(a,b)')
+        self.assertEqual(self.strip('[x, y,]'), '[x, y]')
+
+    def test_whitespace_before_closer_is_removed(self):
+        self.assertEqual(self.strip('Column(\n  children: [a],\n)'), 'Column(\n  children: [a])')
+        self.assertEqual(self.strip('[a,\n  ,\n]'), '[a]')
+
+    def test_runs_of_commas_collapse_completely(self):
+        self.assertEqual(self.strip('f(a, , ,)'), 'f(a)')
+        self.assertEqual(self.strip('f(a,,,b)'), 'f(a,b)')
+
+    def test_other_commas_are_kept(self):
+        self.assertEqual(self.strip('f(a, b, {c: d})'), 'f(a, b, {c: d})')
+
+
+class ReplaceNoneWordsTests(SimpleTestCase):
+    """_replace_none_words must behave exactly like re.sub(r'\\bNone\\b', 'null')"""
+
+    NONE_RE = re.compile(r'\bNone\b')
+
+    def assertMatchesRegex(self, code):
+        self.assertEqual(_replace_none_words(code), self.NONE_RE.sub('null', code), repr(code))
+
+    def test_whole_words_only(self):
+        self.assertEqual(_replace_none_words('Container(color: None, child: None)'),
+                         'Container(color: null, child: null)')
+        self.assertEqual(_replace_none_words('NoneType _None None_ xNone None1'),
+                         'NoneType _None None_ xNone None1')
+        self.assertEqual(_replace_none_words('None'), 'null')
+        self.assertEqual(_replace_none_words(''), '')
+
+    def test_word_characters_beyond_ascii(self):
+        for code in ('éNone', 'Noneé', 'None٣', 'None\u0670', '\nNone\n', 'NoneNone'):
+            self.assertMatchesRegex(code)
+
+    def test_fuzz_against_regex(self):
+        pieces = ['None', 'NoneX', 'xNone', '_None', 'None_', 'None1', 'NNone', 'NoneNone',
+                  'é', '٣', '\u0670', ' ', ',', '(', ')', '\n', 'a', "'"]
+        rng = random.Random(3)
+        for _ in range(5000):
+            self.assertMatchesRegex(''.join(rng.choice(pieces) for _ in range(rng.randint(0, 8))))
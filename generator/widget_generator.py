@@ -1,82 +1,779 @@
 # generator/widget_generator.py
 # FIXED VERSION - Handles Text widgets, enums, and CarouselSlider properly
 
-from django.template import Template, Context
+from django.template import Template, Context, TemplateDoesNotExist, TemplateSyntaxError
+from django.template.base import Node, TextNode, Variable, VariableNode
+from django.template.defaulttags import CommentNode, ForNode, IfNode
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from django.db import connections
+from django.utils.formats import localize
+from django.utils.timezone import template_localtime
+import bisect
+from functools import lru_cache, partial, reduce
+import hashlib
 import json
 import logging
-from typing import Dict, Any, List, Optional
+import operator
+import re
+import sys
+import threading
+from typing import Dict, Any, List, Optional, Callable, NamedTuple, Tuple
+
+from .models import WidgetType
+from .property_handlers import ColorPropertyHandler, PropertyHandlerFactory, unescape_until_stable
 
 logger = logging.getLogger(__name__)
 
 
+class ProcessedProp(NamedTuple):
+    """A widget property after its value has been transformed to Dart code"""
+    name: str
+    value: str
+    type: str
+    is_required: bool
+
+
+# Sibling subtrees are only generated on worker threads when that can actually
+# run Python in parallel (free-threaded builds)
+_GIL_DISABLED = not getattr(sys, '_is_gil_enabled', lambda: True)()
+_parallel_state = threading.local()
+
+
+@lru_cache(maxsize=256)
+def _compile_template(template_string: str) -> Template:
+    """Parse a template string once; the compiled Template is reused across renders"""
+    return Template(template_string)
+
+
+# Property values and keys ("fontSize", "center", ...) repeat across a page
+_unescape_value = lru_cache(maxsize=4096)(unescape_until_stable)
+
+
+# Post-render cleanup patterns for _render_template
+# Python dict syntax like {'key': value}
+_DICT_RE = re.compile(r"\{['\"][\w]+['\"]\s*:\s*[^}]+\}")
+# Simple {'word': null} patterns
+_NULL_DICT_RE = re.compile(r"\{['\"]?\w+['\"]?\s*:\s*null\}")
+_TRAILING_COMMA_RE = re.compile(r',(\s*[}\)])')
+_BLANK_LINES_RE = re.compile(r'\n\s*\n')
+
+# Final output cleanup patterns for _validate_and_clean_output
+# A comma (plus whitespace) directly followed by another comma, ')' or ']'
+_STRAY_COMMA_RE = re.compile(r',\s*(?=[,)\]])')
+
+
+def _clean_rendered(rendered: str) -> str:
+    """Clean up rendered template output in as few passes as possible.
+
+    Each pass is skipped outright when the character it needs is absent,
+    which is the common case for default templates.
+    """
+    # Check for raw Python dict syntax (and {'word': null}) and replace with null
+    if '{' in rendered:
+        rendered = _DICT_RE.sub('null', rendered)
+        rendered = _NULL_DICT_RE.sub('null', rendered)
+
+    # Final safety check - decode HTML entities written into the template
+    # text itself (rendering no longer escapes values; free without a '&')
+    rendered = unescape_until_stable(rendered)
+
+    # Clean up extra commas and whitespace
+    if ',' in rendered:
+        rendered = _TRAILING_COMMA_RE.sub(r'\1', rendered)
+    return _BLANK_LINES_RE.sub('\n', rendered)
+
+
+def _replace_none_words(code: str) -> str:
+    """Replace each whole-word None with null (like re.sub(r'\bNone\b', 'null'))"""
+    start = code.find('None')
+    if start < 0:
+        return code
+
+    parts = []
+    last = 0
+    size = len(code)
+    while start >= 0:
+        end = start + 4
+        # Word boundaries on both sides, with \w meaning alphanumerics and '_'
+        before = code[start - 1] if start else ' '
+        after = code[end] if end < size else ' '
+        if not (before.isalnum() or before == '_' or after.isalnum() or after == '_'):
+            parts.append(code[last:start])
+            parts.append('null')
+            last = end
+        start = code.find('None', end)
+
+    if not parts:
+        return code
+    parts.append(code[last:])
+    return ''.join(parts)
+
+
+@lru_cache(maxsize=None)
+def make_cleaner(strip_badges: bool = True) -> Callable[[str], str]:
+    """Build the final output cleaner for a generator configuration.
+
+    Passes a configuration doesn't need are left out of the generated
+    function rather than checked on every call.
+    """
+    lines = [
+        'def clean(code):',
+        # Remove any "None" values
+        '    code = _replace_none_words(code)',
+    ]
+    if strip_badges:
+        # Remove any undefined prefixes (like badges. if package not available)
+        lines += [
+            "    if 'badges.' in code:",
+            "        code = code.replace('badges.', '')",
+        ]
+    lines += [
+        # Fix any remaining HTML entities
+        '    code = unescape_until_stable(code)',
+        # Remove double commas and trailing commas before ) or ] in one pass
+        "    if ',' in code:",
+        "        code = _STRAY_COMMA_RE.sub('', code)",
+        '    return code',
+    ]
+
+    namespace = {
+        '_replace_none_words': _replace_none_words,
+        'unescape_until_stable': unescape_until_stable,
+        '_STRAY_COMMA_RE': _STRAY_COMMA_RE,
+    }
+    exec(compile('\n'.join(lines), f'<cleaner strip_badges={strip_badges}>', 'exec'), namespace)
+    return namespace['clean']
+
+
+# Escapes for values emitted inside single-quoted Dart string literals
+_DART_STRING_TRANS = str.maketrans({"'": "\\'", "\\": "\\\\", "\n": "\\n"})
+
+# Property formatters for _generate_fallback_widget, keyed by exact value type
+_FALLBACK_FORMATTERS = {
+    str: lambda key, value: f"{key}: '{value.translate(_DART_STRING_TRANS)}'",
+    bool: lambda key, value: f"{key}: {'true' if value else 'false'}",
+    int: lambda key, value: f"{key}: {value}",
+    float: lambda key, value: f"{key}: {value}",
+}
+
+# Shared colour handler for the hand-written widget generators
+_COLOR_HANDLER = ColorPropertyHandler()
+_color_from_string = lru_cache(maxsize=256)(_COLOR_HANDLER.transform)
+
+
+def _color(value: Any) -> str:
+    """Dart code for a colour value; colour strings ('red', '#ff0000') are memoized"""
+    if isinstance(value, str):
+        return _color_from_string(value)
+    return _COLOR_HANDLER.transform(value)
+
+
+# Placeholder widgets emitted over and over; interned so every copy in a
+# generated tree (and in the subtree code cache) is the same object
+_DEFAULT_CHILD = sys.intern("Container()")
+_DEFAULT_BADGE = sys.intern("Text('0')")
+
+# Fixed text around the badge content, colour and child in _generate_badge_widget
+_BADGE_PRE1 = "badges.Badge(\n          badgeContent: "
+_BADGE_MID1 = ",\n          badgeStyle: badges.BadgeStyle(\n            badgeColor: "
+_BADGE_MID2 = ",\n          ),\n          child: "
+_BADGE_SUF = ",\n        )"
+
+
+def _subtree_key(component_data: Dict[str, Any]) -> Optional[bytes]:
+    """Content hash of a component subtree, or None if it isn't JSON data"""
+    try:
+        dumped = json.dumps(component_data, sort_keys=True, separators=(',', ':'))
+    except (TypeError, ValueError):
+        return None
+    return hashlib.blake2b(dumped.encode(), digest_size=16).digest()
+
+
+# Value types whose untyped-property code is memoized per generator
+_PRIMITIVE_TYPES = frozenset({bool, int, float, str})
+
+# Bare colour names _handle_unknown_property treats as colours
+_COLOR_NAMES = frozenset({'red', 'blue', 'green'})
+
+
+def _compile_condition_accessor(key: str) -> Callable[[Dict], Any]:
+    """Build a getter for a (possibly dotted) condition key"""
+    if '.' not in key:
+        return operator.methodcaller('get', key)
+
+    # Nested keys (e.g. "properties.color") are split once here, not per render
+    keys = tuple(key.split('.'))
+
+    def accessor(data):
+        try:
+            return reduce(dict.get, keys, data)
+        except TypeError:
+            # An intermediate value was not a dict
+            return None
+
+    return accessor
+
+
+def _always_matches(component_data: Dict) -> bool:
+    """Condition check for templates without conditions"""
+    return True
+
+
+def _compile_conditions(conditions: Dict) -> Callable[[Dict], bool]:
+    """Precompile template conditions into a single (component_data) -> bool check"""
+    if not conditions:
+        return _always_matches
+
+    checks = []
+    for key, expected_value in conditions.items():
+        if isinstance(expected_value, list):
+            matcher = expected_value.__contains__
+        else:
+            matcher = partial(operator.eq, expected_value)
+        checks.append((_compile_condition_accessor(key), matcher))
+    checks = tuple(checks)
+
+    def matches(component_data):
+        for accessor, match in checks:
+            if not match(accessor(component_data)):
+                return False
+        return True
+
+    return matches
+
+
+@lru_cache(maxsize=1024)
+def _condition_checker(conditions_json: str) -> Callable[[Dict], bool]:
+    """Compiled condition check shared by every template with the same conditions"""
+    return _compile_conditions(json.loads(conditions_json))
+
+
+# Names available to widget templates, in render-function argument order
+_TEMPLATE_CONTEXT_NAMES = ('widget_name', 'properties', 'children', 'widget_type')
+_TEMPLATE_BUILTINS = {'True': True, 'False': False, 'None': None}
+
+
+def _template_lookup(current, bits: Tuple[str, ...], default):
+    """Resolve a dotted template variable the way Django's Variable does"""
+    for bit in bits:
+        try:
+            current = current[bit]
+        except (TypeError, AttributeError, KeyError, ValueError, IndexError):
+            try:
+                current = getattr(current, bit)
+            except (TypeError, AttributeError):
+                try:
+                    current = current[int(bit)]
+                except (IndexError, ValueError, KeyError, TypeError):
+                    return default
+        if callable(current) and not getattr(current, 'do_not_call_in_templates', False):
+            # Never call methods that change data (model.delete, save, ...)
+            if getattr(current, 'alters_data', False):
+                return default
+            try:
+                current = current()
+            except TypeError:
+                return default
+    return current
+
+
+def _template_contains(item, container) -> bool:
+    """Django's `in` operator: failures evaluate to False"""
+    try:
+        return item in container
+    except TypeError:
+        return False
+
+
+def _template_value(value) -> str:
+    """Django's render_value_in_context, without autoescaping"""
+    if type(value) is str:
+        return value
+    return str(localize(template_localtime(value)))
+
+
+class _UnsupportedTemplate(Exception):
+    """Raised when a template uses syntax the render-function compiler doesn't handle"""
+
+
+class _RenderFunctionCompiler:
+    """Translate a parsed Django template into the source of a Python function.
+
+    Only the subset used by widget templates is supported: text, plain
+    variables, {% for %} and {% if %} with ==, !=, in, not, and, or.
+    Anything else raises _UnsupportedTemplate and the template keeps
+    rendering through Django.
+    """
+
+    def __init__(self):
+        self.lines = []
+        self.scope = {name: name for name in _TEMPLATE_CONTEXT_NAMES}
+        self.counter = 0
+
+    def compile(self, nodelist) -> str:
+        self.lines.append(f"def render({', '.join(_TEMPLATE_CONTEXT_NAMES)}):")
+        self.lines.append("    out = []")
+        self.lines.append("    append = out.append")
+        self._nodelist(nodelist, 1)
+        self.lines.append("    return ''.join(out)")
+        return '\n'.join(self.lines)
+
+    def _emit(self, depth: int, line: str):
+        self.lines.append('    ' * depth + line)
+
+    def _nodelist(self, nodelist, depth: int):
+        for node in nodelist:
+            self._node(node, depth)
+
+    def _block(self, nodelist, depth: int):
+        start = len(self.lines)
+        self._nodelist(nodelist, depth)
+        if len(self.lines) == start:
+            self._emit(depth, "pass")
+
+    def _node(self, node: Node, depth: int):
+        if isinstance(node, TextNode):
+            if node.s:
+                self._emit(depth, f"append({node.s!r})")
+        elif isinstance(node, VariableNode):
+            self._emit(depth, f"append(_template_value({self._expression(node.filter_expression, repr(''))}))")
+        elif isinstance(node, ForNode):
+            self._for(node, depth)
+        elif isinstance(node, IfNode):
+            self._if(node, depth)
+        elif isinstance(node, CommentNode):
+            pass
+        else:
+            raise _UnsupportedTemplate(type(node).__name__)
+
+    def _for(self, node: ForNode, depth: int):
+        if node.is_reversed or len(node.loopvars) != 1:
+            raise _UnsupportedTemplate('for')
+
+        self.counter += 1
+        loop_var = f"_v{self.counter}"
+        name = node.loopvars[0]
+
+        sequence = self._expression(node.sequence, 'None')
+        seq_var = f"_s{self.counter}"
+        self._emit(depth, f"{seq_var} = {sequence} or ()")
+
+        outer = self.scope.get(name)
+        self.scope[name] = loop_var
+        self._emit(depth, f"for {loop_var} in {seq_var}:")
+        self._block(node.nodelist_loop, depth + 1)
+        if outer is None:
+            del self.scope[name]
+        else:
+            self.scope[name] = outer
+
+        if node.nodelist_empty:
+            self._emit(depth, f"if not {seq_var}:")
+            self._block(node.nodelist_empty, depth + 1)
+
+    def _if(self, node: IfNode, depth: int):
+        keyword = 'if'
+        for condition, nodelist in node.conditions_nodelists:
+            if condition is None:
+                self._emit(depth, "else:")
+            else:
+                self._emit(depth, f"{keyword} {self._condition(condition)}:")
+            self._block(nodelist, depth + 1)
+            keyword = 'elif'
+
+    def _condition(self, condition) -> str:
+        op = condition.id
+        if op == 'literal':
+            return self._expression(condition.value, 'None')
+        if op == 'not':
+            return f"(not {self._condition(condition.first)})"
+        if op in ('and', 'or', '==', '!='):
+            return f"({self._condition(condition.first)} {op} {self._condition(condition.second)})"
+        if op == 'in':
+            return f"_template_contains({self._condition(condition.first)}, {self._condition(condition.second)})"
+        if op == 'not in':
+            return f"(not _template_contains({self._condition(condition.first)}, {self._condition(condition.second)}))"
+        raise _UnsupportedTemplate(op)
+
+    def _expression(self, filter_expression, default: str) -> str:
+        if filter_expression.filters:
+            raise _UnsupportedTemplate('filters')
+
+        var = filter_expression.var
+        if not isinstance(var, Variable):
+            # Quoted string constant
+            return repr(str(var))
+        if var.translate or var.message_context:
+            raise _UnsupportedTemplate('translation')
+        if var.lookups is None:
+            return repr(var.literal)
+
+        name, bits = var.lookups[0], var.lookups[1:]
+        if name == 'forloop':
+            raise _UnsupportedTemplate('forloop')
+        if name in self.scope:
+            target = self.scope[name]
+        elif name in _TEMPLATE_BUILTINS:
+            target = repr(_TEMPLATE_BUILTINS[name])
+        else:
+            return default
+
+        if not bits:
+            return target
+        return f"_template_lookup({target}, {bits!r}, {default})"
+
+
+@lru_cache(maxsize=256)
+def _compile_render_function(template_code: str) -> Optional[Callable]:
+    """Compile a widget template into a plain Python render function.
+
+    Cached by template code, so generators created per request don't
+    recompile the same templates. Returns None if the template can't be
+    compiled, in which case it is rendered with Django as before.
+    """
+    try:
+        nodelist = _compile_template(template_code).nodelist
+        source = _RenderFunctionCompiler().compile(nodelist)
+    except (TemplateSyntaxError, _UnsupportedTemplate) as e:
+        logger.debug(f"Widget template rendered through Django: {str(e)}")
+        return None
+
+    namespace = {
+        '_template_lookup': _template_lookup,
+        '_template_contains': _template_contains,
+        '_template_value': _template_value,
+    }
+    exec(compile(source, '<widget template>', 'exec'), namespace)
+    return namespace['render']
+
+
 class DynamicWidgetGenerator:
     """Generate Flutter widget code from database definitions"""
 
-    def __init__(self):
-        from .property_handlers import PropertyHandlerFactory
+    # Upper bound on cached widget types (least recently used are evicted)
+    WIDGET_CACHE_SIZE = 256
+
+    # Containers with at least this many widget children may generate them
+    # concurrently (see _can_generate_in_parallel)
+    PARALLEL_CHILDREN_THRESHOLD = 8
+    PARALLEL_MAX_WORKERS = 4
+
+    # Related rows loaded along with every cached widget type, so rendering
+    # doesn't query per widget
+    WIDGET_TYPE_PREFETCH = ('properties', 'templates')
+
+    # Upper bound on generated code cached per identical component subtree
+    CODE_CACHE_SIZE = 512
+
+    # Upper bound on memoized code for untyped primitive property values
+    UNKNOWN_PRIMITIVE_CACHE_SIZE = 4096
+
+    # Widgets generated by hand instead of through their templates
+    SPECIAL_WIDGET_HANDLERS = {
+        'CarouselSlider': '_generate_carousel_slider',
+        'Text': '_generate_text_widget',
+        'Icon': '_generate_icon_widget',
+        'IconButton': '_generate_button_widget',
+        'FloatingActionButton': '_generate_button_widget',
+        'Badge': '_generate_badge_widget',
+        'badges.Badge': '_generate_badge_widget',
+        'SpeedDial': '_generate_speed_dial_widget',
+    }
+
+    def __init__(self, strip_badges: bool = True):
         self.handler_factory = PropertyHandlerFactory
-        self.widget_cache = {}
+        # Final output cleaner; strip_badges=False keeps the badges. prefix
+        # for projects that depend on the badges package
+        self._cleaner = make_cleaner(strip_badges)
+        self.widget_cache = OrderedDict()
+        # Guards widget_cache, missing_widget_types and _handler_for_prop, which
+        # parallel child workers (see _generate_children_parallel) share
+        self._cache_lock = threading.RLock()
+        # Names already looked up and not found (unknown or inactive types,
+        # and non-widget {'type': ...} values such as gradients)
+        self.missing_widget_types = set()
+        self.import_cache = {}
+        # Property handlers are stateless transforms, so one per property definition
+        self._handler_for_prop = {}
+        # Shared handler for padding/margin values
+        self._edge_insets_handler = self.handler_factory.get_handler('edge_insets')
+        # Containers decoded during the current generate_widget_tree call, by
+        # id (the values keep them alive, so ids can't be reused meanwhile)
+        self._decoded = {}
+        # Generated code by subtree content hash (see _generate_subtree)
+        self._code_cache = OrderedDict()
+        self._code_cache_lock = threading.Lock()
+        # Untyped primitive values repeat a lot across a tree (true, 0, 'center', ...);
+        # typed so that True, 1 and 1.0 stay separate entries
+        self._unknown_primitive_code = lru_cache(
+            maxsize=self.UNKNOWN_PRIMITIVE_CACHE_SIZE, typed=True
+        )(self._handle_primitive_prop)
+
+    def _get_cached_widget_type(self, widget_type_name: str):
+        """Return a cached widget type (marking it recently used), or None"""
+        with self._cache_lock:
+            widget_type = self.widget_cache.get(widget_type_name)
+            if widget_type is not None:
+                self.widget_cache.move_to_end(widget_type_name)
+            return widget_type
+
+    def _cache_widget_type(self, widget_type_name: str, widget_type):
+        """Cache a widget type, evicting the least recently used entry when full"""
+        # Schema property names only depend on the type, so work them out once here
+        widget_type._defined_prop_names = frozenset(p.name for p in widget_type.properties.all())
+        with self._cache_lock:
+            self.widget_cache[widget_type_name] = widget_type
+            self.widget_cache.move_to_end(widget_type_name)
+            if len(self.widget_cache) > self.WIDGET_CACHE_SIZE:
+                self.widget_cache.popitem(last=False)
 
     def _decode_html_deeply(self, value):
         """Decode HTML entities multiple times to handle nested encoding"""
-        import html
         if isinstance(value, str):
-            decoded = value
-            # Decode up to 5 times to handle deep nesting
-            for _ in range(5):
-                prev = decoded
-                decoded = html.unescape(decoded)
-                if decoded == prev:
-                    break
-            return decoded
-        elif isinstance(value, dict):
-            return {self._decode_html_deeply(k): self._decode_html_deeply(v)
-                    for k, v in value.items()}
-        elif isinstance(value, list):
-            return [self._decode_html_deeply(item) for item in value]
-        else:
+            # Most strings carry no entities at all
+            return _unescape_value(value) if '&' in value else value
+        if not isinstance(value, (dict, list)):
             return value
 
+        # Already decoded as part of the tree being generated
+        if id(value) in self._decoded:
+            return value
+
+        # Plain string and scalar leaves - nearly all of a tree - are handled
+        # inline; only nested containers (and subclasses) recurse
+        decode = self._decode_html_deeply
+        if isinstance(value, dict):
+            decoded = {}
+            for k, v in value.items():
+                if type(k) is not str:
+                    k = decode(k)
+                elif '&' in k:
+                    k = _unescape_value(k)
+                value_type = type(v)
+                if value_type is str:
+                    if '&' in v:
+                        v = _unescape_value(v)
+                elif v is not None and value_type is not int and value_type is not bool:
+                    v = decode(v)
+                decoded[k] = v
+        else:
+            decoded = []
+            for v in value:
+                value_type = type(v)
+                if value_type is str:
+                    if '&' in v:
+                        v = _unescape_value(v)
+                elif v is not None and value_type is not int and value_type is not bool:
+                    v = decode(v)
+                decoded.append(v)
+
+        self._decoded[id(decoded)] = decoded
+        return decoded
+
     def generate_widget(self, component_data: Dict[str, Any]) -> str:
         """Generate widget code from component data"""
+        return self.generate_widget_tree(component_data)
+
+    def generate_widget_tree(self, root: Dict[str, Any]) -> str:
+        """Generate code for a whole component tree.
+
+        HTML entities are decoded for the entire tree up front, so nested
+        widgets built along the way (_generate_subtree) skip that step.
+        """
+        # Nested generate_widget calls (e.g. from the widget_list handler)
+        # run while the outermost call's decoded containers are registered
+        outermost = not self._decoded
         try:
-            from .models import WidgetType
+            return self._generate_subtree(self._decode_html_deeply(root))
+        finally:
+            if outermost:
+                self._decoded.clear()
+
+    def _generate_subtree(self, component_data: Dict[str, Any]) -> str:
+        """Generate code for an already decoded component (sub)tree.
+
+        Repeated subtrees (the same badge or list item on every row) are
+        generated once and served from a bounded LRU keyed by content hash.
+        """
+        key = _subtree_key(component_data)
+        if key is not None:
+            with self._code_cache_lock:
+                code = self._code_cache.get(key)
+                if code is not None:
+                    self._code_cache.move_to_end(key)
+                    return code
+
+        code = self._generate_uncached(component_data)
+
+        if key is not None:
+            with self._code_cache_lock:
+                self._code_cache[key] = code
+                if len(self._code_cache) > self.CODE_CACHE_SIZE:
+                    self._code_cache.popitem(last=False)
+        return code
+
+    def _generate_uncached(self, component_data: Dict[str, Any]) -> str:
+        """Walk a decoded component tree and generate its code"""
+        # Load every widget type used in the tree with a single query
+        self.prime_cache(component_data)
+
+        # Walk the tree iteratively in post-order instead of recursing through
+        # _process_children -> generate_widget. Finished child code is kept on
+        # `rendered` until its parent container is assembled.
+        rendered = []
+        stack = deque([(component_data, None)])
+        while stack:
+            node, state = stack.pop()
+
+            if isinstance(node, str):
+                # Direct widget reference
+                rendered.append(node)
+                continue
+
+            if state is None:
+                state = self._prepare_widget(node)
+                if isinstance(state, str):
+                    rendered.append(state)
+                    continue
 
-            # Decode all HTML entities in component data first
-            component_data = self._decode_html_deeply(component_data)
+                # Revisit this node once all of its children are rendered
+                stack.append((node, state))
+                child_nodes = state[3]
+                if self._can_generate_in_parallel(child_nodes):
+                    # Finished code comes back as strings, which are then
+                    # pushed like direct widget references
+                    child_nodes = self._generate_children_parallel(child_nodes)
+                stack.extend((child, None) for child in reversed(child_nodes))
+                continue
 
+            widget_type, template, processed_props, child_nodes = state
+            split_at = len(rendered) - len(child_nodes)
+            children = rendered[split_at:]
+            del rendered[split_at:]
+            code = self._render_widget_known(
+                node,
+                widget_type,
+                template,
+                processed_props,
+                children
+            )
+            if not stack:
+                # Validate and clean once, at the top of the walk - the code
+                # of every templated widget below is embedded in this one
+                code = self._validate_and_clean_output(code)
+            rendered.append(code)
+
+        return rendered[0]
+
+    def prime_cache(self, component_tree: Dict[str, Any]):
+        """Warm widget_cache with one query for every uncached widget type in the tree"""
+        names = set()
+        pending = [component_tree]
+        while pending:
+            value = pending.pop()
+            if isinstance(value, dict):
+                widget_type_name = value.get('type')
+                if isinstance(widget_type_name, str):
+                    names.add(widget_type_name)
+                pending.extend(value.values())
+            elif isinstance(value, list):
+                pending.extend(value)
+
+        with self._cache_lock:
+            missing = [name for name in names
+                       if name not in self.widget_cache and name not in self.missing_widget_types]
+        if not missing:
+            return
+
+        found = set()
+        try:
+            widget_types = WidgetType.objects.filter(
+                name__in=missing,
+                is_active=True
+            ).prefetch_related(*self.WIDGET_TYPE_PREFETCH)
+            for widget_type in widget_types:
+                self._cache_widget_type(widget_type.name, widget_type)
+                found.add(widget_type.name)
+        except Exception as e:
+            # Carry on uncached; each widget then falls back on its own lookup
+            logger.error(f"Error loading widget types: {str(e)}")
+            return
+        with self._cache_lock:
+            self.missing_widget_types.update(name for name in missing if name not in found)
+
+    def _can_generate_in_parallel(self, child_nodes: List) -> bool:
+        """Whether a container's children are worth generating on a thread pool"""
+        if not _GIL_DISABLED or getattr(_parallel_state, 'active', False):
+            return False
+
+        widget_children = [child for child in child_nodes if isinstance(child, dict)]
+        if len(widget_children) < self.PARALLEL_CHILDREN_THRESHOLD:
+            return False
+
+        # Only when the widget type cache is already warm for every sibling
+        # (a non-string type can't be cached; it falls back on the sequential path)
+        with self._cache_lock:
+            return all(isinstance(child.get('type'), str) and child['type'] in self.widget_cache
+                       for child in widget_children)
+
+    def _generate_children_parallel(self, child_nodes: List) -> List[str]:
+        """Generate sibling subtrees concurrently, keeping their order"""
+        chunk_size = -(-len(child_nodes) // self.PARALLEL_MAX_WORKERS)
+        chunks = [child_nodes[i:i + chunk_size] for i in range(0, len(child_nodes), chunk_size)]
+
+        with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+            results = executor.map(self._generate_children_chunk, chunks)
+            return [code for chunk in results for code in chunk]
+
+    def _generate_children_chunk(self, child_nodes: List) -> List[str]:
+        """Worker: generate a run of siblings, without nesting further pools"""
+        _parallel_state.active = True
+        try:
+            return [child if isinstance(child, str) else self._generate_subtree(child)
+                    for child in child_nodes]
+        finally:
+            _parallel_state.active = False
+            # Worker threads get their own DB connections; don't leak them
+            connections.close_all()
+
+    def _prepare_widget(self, component_data: Dict[str, Any]):
+        """Resolve a widget up to the point where its children are needed.
+
+        Returns the finished code for leaf/special widgets, otherwise a
+        (widget_type, template, processed_props, child_nodes) tuple.
+        """
+        try:
             # Get widget type from database
             widget_type_name = component_data.get('type')
             if not widget_type_name:
                 return self._generate_fallback_widget(component_data)
 
             # Check cache first
-            if widget_type_name in self.widget_cache:
-                widget_type = self.widget_cache[widget_type_name]
-            else:
+            widget_type = self._get_cached_widget_type(widget_type_name)
+            if widget_type is None:
                 try:
-                    widget_type = WidgetType.objects.get(name=widget_type_name, is_active=True)
-                    self.widget_cache[widget_type_name] = widget_type
+                    with self._cache_lock:
+                        known_missing = widget_type_name in self.missing_widget_types
+                    if known_missing:
+                        raise WidgetType.DoesNotExist
+                    widget_type = WidgetType.objects.prefetch_related(
+                        *self.WIDGET_TYPE_PREFETCH
+                    ).get(name=widget_type_name, is_active=True)
+                    self._cache_widget_type(widget_type_name, widget_type)
                 except WidgetType.DoesNotExist:
+                    with self._cache_lock:
+                        self.missing_widget_types.add(widget_type_name)
                     logger.warning(f"Widget type '{widget_type_name}' not found in database")
                     return self._generate_fallback_widget(component_data)
 
             # Special handling for specific widgets
-            if widget_type_name == 'CarouselSlider':
-                return self._generate_carousel_slider(component_data)
-            elif widget_type_name == 'Text':
-                return self._generate_text_widget(component_data)
-            elif widget_type_name == 'Icon':
-                return self._generate_icon_widget(component_data)
-            elif widget_type_name in ['IconButton', 'FloatingActionButton']:
-                return self._generate_button_widget(component_data)
-            elif widget_type_name == 'Badge' or widget_type_name == 'badges.Badge':
-                return self._generate_badge_widget(component_data)
-            elif widget_type_name == 'SpeedDial':
-                return self._generate_speed_dial_widget(component_data)
+            special_handler = self.SPECIAL_WIDGET_HANDLERS.get(widget_type_name)
+            if special_handler is not None:
+                return getattr(self, special_handler)(component_data)
 
             # Get the template
-            template_string = self._get_template(widget_type, component_data)
+            template = self._get_template(widget_type, component_data)
 
             # Process properties
             processed_props = self._process_properties(
@@ -84,20 +781,30 @@ class DynamicWidgetGenerator:
                 component_data.get('properties', {})
             )
 
-            # Handle children if it's a container
-            children = None
+            # Collect children if it's a container
+            child_nodes = []
             if widget_type.is_container:
-                children = self._process_children(component_data.get('children', []))
+                child_nodes = self._process_children(component_data.get('children', []))
+
+            return widget_type, template, processed_props, child_nodes
 
+        except Exception as e:
+            logger.error(f"Error generating widget: {str(e)}")
+            return self._generate_fallback_widget(component_data)
+
+    def _render_widget_known(self, component_data: Dict[str, Any], widget_type, template: Tuple,
+                             processed_props: List[ProcessedProp], children: List[str]) -> str:
+        """Render a resolved widget once its children have been generated"""
+        template_string, render_function = template
+        try:
             # Generate code using template
             code = self._render_template(
                 template_string,
                 widget_type,
                 processed_props,
-                children
+                children,
+                render_function
             )
-            # Validate and clean before returning
-            code = self._validate_and_clean_output(code)
             return code
 
         except Exception as e:
@@ -106,19 +813,14 @@ class DynamicWidgetGenerator:
 
     def _generate_text_widget(self, component_data: Dict[str, Any]) -> str:
         """Special handling for Text widget to ensure data is always present"""
+        # Properties were already decoded along with the whole tree
         props = component_data.get('properties', {})
 
-        # Decode properties deeply first
-        props = self._decode_html_deeply(props)
-
         # Get text data - REQUIRED for Text widget
-        text_data = props.get('data', props.get('text', 'Text'))
-
-        # Additional safety - decode again if needed
-        text_data = self._decode_html_deeply(str(text_data))
+        text_data = str(props.get('data', props.get('text', 'Text')))
 
-        # Escape single quotes in text
-        text_data = text_data.replace("'", "\\'")
+        # Escape quotes, backslashes and newlines for the Dart string literal
+        text_data = text_data.translate(_DART_STRING_TRANS)
 
         # Handle text style
         style_props = []
@@ -133,19 +835,17 @@ class DynamicWidgetGenerator:
                         weight = f"FontWeight.{weight}"
                     style_props.append(f"fontWeight: {weight}")
                 if 'color' in style:
-                    from .property_handlers import ColorPropertyHandler
-                    color_handler = ColorPropertyHandler()
-                    color = color_handler.transform(style['color'])
+                    color = _color(style['color'])
                     style_props.append(f"color: {color}")
         elif 'fontSize' in props:
             style_props.append(f"fontSize: {props['fontSize']}.0")
 
         # Build Text widget
+        parts = ["Text('", text_data, "'"]
         if style_props:
-            style = f"TextStyle({', '.join(style_props)})"
-            return f"Text('{text_data}', style: {style})"
-        else:
-            return f"Text('{text_data}')"
+            parts += (", style: TextStyle(", ', '.join(style_props), ")")
+        parts.append(")")
+        return ''.join(parts)
 
     def _generate_carousel_slider(self, component_data: Dict[str, Any]) -> str:
         """Special handling for CarouselSlider with proper structure"""
@@ -157,10 +857,10 @@ class DynamicWidgetGenerator:
 
         for item in items:
             if isinstance(item, dict):
-                item_code = self.generate_widget(item)
+                item_code = self._generate_subtree(item)
                 items_code.append(item_code)
             else:
-                items_code.append("Container()")
+                items_code.append(_DEFAULT_CHILD)
 
         if not items_code:
             items_code = ["Container(color: Colors.grey, child: Center(child: Text('Slide 1')))"]
@@ -168,10 +868,12 @@ class DynamicWidgetGenerator:
         # Process options
         options = props.get('options', {})
         option_props = []
+        has_height = False
 
         if isinstance(options, dict):
             if 'height' in options:
                 option_props.append(f"height: {options['height']}.0")
+                has_height = True
             if 'autoPlay' in options:
                 option_props.append(f"autoPlay: {str(options['autoPlay']).lower()}")
             if 'autoPlayInterval' in options:
@@ -184,50 +886,67 @@ class DynamicWidgetGenerator:
                 option_props.append(f"enlargeCenterPage: {str(options['enlargeCenterPage']).lower()}")
 
         # Default height if not specified
-        if not any('height' in prop for prop in option_props):
+        if not has_height:
             option_props.append("height: 200.0")
 
         # Build CarouselSlider
-        options_str = f"CarouselOptions({', '.join(option_props)})" if option_props else "CarouselOptions(height: 200.0)"
+        parts = [
+            "CarouselSlider(\n  options: CarouselOptions(",
+            ', '.join(option_props),
+            "),\n  items: [\n    ",
+            ",\n    ".join(items_code),
+            "\n  ],\n)",
+        ]
+        return ''.join(parts)
 
-        items_str = "[\n    " + ",\n    ".join(items_code) + "\n  ]"
+    def _get_template(self, widget_type, component_data: Dict) -> Tuple[Optional[str], Optional[Callable]]:
+        """Get the best matching template (and its precompiled render function) for this widget.
 
-        return f"CarouselSlider(\n  options: {options_str},\n  items: {items_str},\n)"
-
-    def _get_template(self, widget_type, component_data: Dict) -> str:
-        """Get the best matching template for this widget"""
+        Returns (None, None) when the default layout should be used.
+        """
 
         # Try to find a template with matching conditions
-        templates = widget_type.templates.filter(is_active=True).order_by('-priority')
-
-        for template in templates:
-            if self._matches_conditions(template.conditions, component_data):
-                return template.template_code
-
-        # Fallback to default template
-        return self._get_default_template(widget_type)
-
-    def _get_default_template(self, widget_type) -> str:
-        """Generate a default template based on widget structure"""
-
-        if widget_type.is_container and widget_type.can_have_multiple_children:
-            return """{{ widget_name }}(
-{% for prop in properties %}{% if prop.value != "null" %}  {{ prop.name }}: {{ prop.value }},
-{% endif %}{% endfor %}{% if children %}  children: [
-{% for child in children %}    {{ child }},
-{% endfor %}  ],
-{% endif %})"""
-        elif widget_type.is_container:
-            return """{{ widget_name }}(
-{% for prop in properties %}{% if prop.value != "null" %}  {{ prop.name }}: {{ prop.value }},
-{% endif %}{% endfor %}{% if children %}  child: {{ children.0 }},
-{% endif %})"""
-        else:
-            return """{{ widget_name }}(
-{% for prop in properties %}{% if prop.value != "null" %}  {{ prop.name }}: {{ prop.value }},
-{% endif %}{% endfor %})"""
+        for template in self._get_active_templates(widget_type):
+            if template._condition_checker(component_data):
+                return template.template_code, template._render_function
+
+        # No matching template - use the built-in default layout
+        return None, None
+
+    def _get_active_templates(self, widget_type) -> List:
+        """Load active templates once per cached widget type, with conditions precompiled"""
+        templates = getattr(widget_type, '_active_templates', None)
+        if templates is None:
+            if 'templates' in getattr(widget_type, '_prefetched_objects_cache', {}):
+                # Reuse the prefetched rows (already ordered by -priority)
+                templates = [t for t in widget_type.templates.all() if t.is_active]
+            else:
+                templates = list(widget_type.templates.filter(is_active=True).order_by('-priority'))
+            for template in templates:
+                template._condition_checker = _condition_checker(
+                    json.dumps(template.conditions or {}, sort_keys=True)
+                )
+                template._render_function = _compile_render_function(template.template_code)
+            widget_type._active_templates = templates
+        return templates
+
+    def _render_default(self, widget_type, properties: List[ProcessedProp], children: List[str]) -> str:
+        """Render the default widget layout directly, without a template engine"""
+        parts = [widget_type.dart_class_name, "(\n"]
+        parts.extend(f"  {prop.name}: {prop.value},\n" for prop in properties if prop.value != "null")
+
+        if children and widget_type.is_container:
+            if widget_type.can_have_multiple_children:
+                parts.append("  children: [\n")
+                parts.extend(f"    {child},\n" for child in children)
+                parts.append("  ],\n")
+            else:
+                parts.append(f"  child: {children[0]},\n")
+
+        parts.append(")")
+        return "".join(parts)
 
-    def _process_properties(self, widget_type, raw_properties: Dict) -> List[Dict]:
+    def _process_properties(self, widget_type, raw_properties: Dict) -> List[ProcessedProp]:
         """Process properties using appropriate handlers"""
 
         processed = []
@@ -259,9 +978,6 @@ class DynamicWidgetGenerator:
                 # Skip None values
                 if prop_value is None or prop_value == "None":
                     continue
-
-                # Decode HTML entities if string
-                prop_value = self._decode_html_deeply(prop_value)
             elif prop_def.default_value:
                 try:
                     prop_value = json.loads(prop_def.default_value)
@@ -274,45 +990,8 @@ class DynamicWidgetGenerator:
             if prop_value is None and not prop_def.is_required:
                 continue
 
-            # Get appropriate handler
-            handler_kwargs = {}
-
-            # Special handling for enum properties
-            if prop_def.property_type == 'enum':
-                # Common Flutter enums
-                if prop_name == 'mainAxisAlignment':
-                    handler_kwargs = {
-                        'enum_class': 'MainAxisAlignment',
-                        'allowed_values': ['start', 'end', 'center', 'spaceBetween', 'spaceAround', 'spaceEvenly']
-                    }
-                elif prop_name == 'crossAxisAlignment':
-                    handler_kwargs = {
-                        'enum_class': 'CrossAxisAlignment',
-                        'allowed_values': ['start', 'end', 'center', 'stretch', 'baseline']
-                    }
-                elif prop_name == 'textAlign':
-                    handler_kwargs = {
-                        'enum_class': 'TextAlign',
-                        'allowed_values': ['left', 'right', 'center', 'justify', 'start', 'end']
-                    }
-                elif prop_name == 'fit':
-                    handler_kwargs = {
-                        'enum_class': 'BoxFit',
-                        'allowed_values': ['fill', 'contain', 'cover', 'fitWidth', 'fitHeight', 'none', 'scaleDown']
-                    }
-                elif prop_def.allowed_values:
-                    handler_kwargs = {
-                        'enum_class': prop_def.dart_type.split('.')[
-                            0] if '.' in prop_def.dart_type else prop_def.dart_type,
-                        'allowed_values': prop_def.allowed_values.get('values', [])
-                    }
-            elif prop_def.property_type in ['widget', 'widget_list']:
-                handler_kwargs = {'widget_generator': self}
-
-            handler = self.handler_factory.get_handler(
-                prop_def.property_type,
-                **handler_kwargs
-            )
+            # Get appropriate handler (resolved once per property definition)
+            handler = self._handler_for_prop.get(prop_def.pk) or self._resolve_handler_for_prop(prop_def)
 
             # Validate value
             if not handler.validate(prop_value):
@@ -328,8 +1007,7 @@ class DynamicWidgetGenerator:
                 # This shouldn't be a raw dict in Flutter code
                 if prop_name == 'padding':
                     # Force EdgeInsets transformation
-                    edge_handler = self.handler_factory.get_handler('edge_insets')
-                    dart_value = edge_handler.transform(prop_value)
+                    dart_value = self._edge_insets_handler.transform(prop_value)
                 elif prop_name == 'decoration':
                     # Handle decoration - if it's empty or has null gradient, just use null
                     if not prop_value or prop_value.get('gradient') is None:
@@ -342,100 +1020,178 @@ class DynamicWidgetGenerator:
                     dart_value = "null"
 
             # Don't output raw Python dict syntax
-            if str(dart_value).startswith('{') and str(dart_value).endswith('}') and ':' in str(dart_value):
+            dart_text = dart_value if isinstance(dart_value, str) else str(dart_value)
+            if dart_text[:1] == '{' and dart_text[-1:] == '}' and ':' in dart_text:
                 dart_value = "null"  # Fallback to null instead of invalid syntax
 
-            processed.append({
-                'name': prop_name,
-                'value': dart_value,
-                'type': prop_def.property_type,
-                'is_required': prop_def.is_required
-            })
+            processed.append(ProcessedProp(
+                prop_name,
+                dart_value,
+                prop_def.property_type,
+                prop_def.is_required
+            ))
 
         # Handle any extra properties not defined in the schema
-        defined_props = {p.name for p in property_defs}
+        defined_props = widget_type._defined_prop_names
         for prop_name, prop_value in raw_properties.items():
             if prop_name not in defined_props and prop_name not in ['items', 'options']:
                 # Try to guess the type and handle it
                 dart_value = self._handle_unknown_property(prop_name, prop_value)
                 if dart_value:
-                    processed.append({
-                        'name': prop_name,
-                        'value': dart_value,
-                        'type': 'unknown',
-                        'is_required': False
-                    })
+                    processed.append(ProcessedProp(prop_name, dart_value, 'unknown', False))
 
         return processed
 
+    def _resolve_handler_for_prop(self, prop_def):
+        """Pick the handler for a property definition and memoize it by pk"""
+        handler_kwargs = {}
+
+        # Special handling for enum properties
+        if prop_def.property_type == 'enum':
+            # Common Flutter enums
+            if prop_def.name == 'mainAxisAlignment':
+                handler_kwargs = {
+                    'enum_class': 'MainAxisAlignment',
+                    'allowed_values': ['start', 'end', 'center', 'spaceBetween', 'spaceAround', 'spaceEvenly']
+                }
+            elif prop_def.name == 'crossAxisAlignment':
+                handler_kwargs = {
+                    'enum_class': 'CrossAxisAlignment',
+                    'allowed_values': ['start', 'end', 'center', 'stretch', 'baseline']
+                }
+            elif prop_def.name == 'textAlign':
+                handler_kwargs = {
+                    'enum_class': 'TextAlign',
+                    'allowed_values': ['left', 'right', 'center', 'justify', 'start', 'end']
+                }
+            elif prop_def.name == 'fit':
+                handler_kwargs = {
+                    'enum_class': 'BoxFit',
+                    'allowed_values': ['fill', 'contain', 'cover', 'fitWidth', 'fitHeight', 'none', 'scaleDown']
+                }
+            elif prop_def.allowed_values:
+                handler_kwargs = {
+                    'enum_class': prop_def.dart_type.split('.')[
+                        0] if '.' in prop_def.dart_type else prop_def.dart_type,
+                    'allowed_values': prop_def.allowed_values.get('values', [])
+                }
+        elif prop_def.property_type in ['widget', 'widget_list']:
+            handler_kwargs = {'widget_generator': self}
+
+        handler = self.handler_factory.get_handler(
+            prop_def.property_type,
+            **handler_kwargs
+        )
+        with self._cache_lock:
+            self._handler_for_prop[prop_def.pk] = handler
+        return handler
+
     def _handle_unknown_property(self, name: str, value: Any) -> Optional[str]:
         """Handle properties not defined in the widget schema"""
 
         if value is None:
             return None
 
-        # Try to guess the type based on the value
-        if isinstance(value, bool):
-            handler = self.handler_factory.get_handler('bool')
-        elif isinstance(value, int):
-            handler = self.handler_factory.get_handler('int')
-        elif isinstance(value, float):
-            handler = self.handler_factory.get_handler('double')
-        elif isinstance(value, str):
-            # Check if it looks like a color
-            if value.startswith('#') or value.startswith('0x') or value in ['red', 'blue', 'green']:
-                handler = self.handler_factory.get_handler('color')
-            # Check if it's an enum value (contains no spaces and is lowercase or camelCase)
-            elif not ' ' in value and (value.islower() or value[0].islower()):
-                # Try to detect common enum patterns
-                if name == 'mainAxisAlignment':
-                    return f"MainAxisAlignment.{value}"
-                elif name == 'crossAxisAlignment':
-                    return f"CrossAxisAlignment.{value}"
-                else:
-                    handler = self.handler_factory.get_handler('string')
+        # Plain bool/int/float/str values always produce the same code
+        value_type = type(value)
+        if value_type in _PRIMITIVE_TYPES:
+            return self._unknown_primitive_code(name, value)
+
+        # Try to guess the type based on the value - exact type first,
+        # subclasses through the isinstance checks
+        handle = self._TYPE_DISPATCH.get(value_type)
+        if handle is None:
+            handle = self._dispatch_by_isinstance(value)
+            if handle is None:
+                return None
+
+        return handle(self, name, value)
+
+    def _handle_primitive_prop(self, name: str, value: Any) -> Optional[str]:
+        """Uncached code for an exact bool/int/float/str value"""
+        return self._TYPE_DISPATCH[type(value)](self, name, value)
+
+    def _dispatch_by_isinstance(self, value: Any) -> Optional[Callable]:
+        """Handler lookup for subclasses of the dispatched types"""
+        for value_type in (bool, int, float, str, dict, list):
+            if isinstance(value, value_type):
+                return self._TYPE_DISPATCH[value_type]
+        return None
+
+    def _handle_bool_prop(self, name: str, value: bool) -> str:
+        return self.handler_factory.get_handler('bool').transform(value)
+
+    def _handle_int_prop(self, name: str, value: int) -> str:
+        return self.handler_factory.get_handler('int').transform(value)
+
+    def _handle_double_prop(self, name: str, value: float) -> str:
+        return self.handler_factory.get_handler('double').transform(value)
+
+    def _handle_string_prop(self, name: str, value: str) -> Optional[str]:
+        # Check if it looks like a color
+        if value.startswith(('#', '0x')) or value in _COLOR_NAMES:
+            handler = self.handler_factory.get_handler('color')
+        # Check if it's an enum value (contains no spaces and is lowercase or camelCase);
+        # the first character settles most values without scanning the whole string
+        elif ' ' not in value and (value[:1].islower() or value.islower()):
+            # Try to detect common enum patterns
+            if name == 'mainAxisAlignment':
+                return f"MainAxisAlignment.{value}"
+            elif name == 'crossAxisAlignment':
+                return f"CrossAxisAlignment.{value}"
             else:
                 handler = self.handler_factory.get_handler('string')
-        elif isinstance(value, dict):
-            # Could be a widget or complex property
-            if 'type' in value:
-                return self.generate_widget(value)
-            elif name == 'padding':
-                # Special case for padding
-                handler = self.handler_factory.get_handler('edge_insets')
-                return handler.transform(value)
-            elif name == 'margin':
-                # Special case for margin
-                handler = self.handler_factory.get_handler('edge_insets')
-                return handler.transform(value)
-            elif name == 'decoration':
-                # Special case for decoration
-                if not value or all(v is None for v in value.values()):
-                    return "null"
-                return "BoxDecoration()"  # Basic decoration
-            else:
-                # For other dicts, return null instead of raw dict
-                return "null"
-        elif isinstance(value, list):
-            # Try to handle as a list
-            if value and isinstance(value[0], dict) and 'type' in value[0]:
-                # List of widgets
-                handler = self.handler_factory.get_handler('widget_list', widget_generator=self)
-            else:
-                # Generic list - transform each item
-                items = []
-                for item in value:
-                    item_dart = self._handle_unknown_property(f"{name}_item", item)
-                    if item_dart:
-                        items.append(item_dart)
-                return f"[{', '.join(items)}]" if items else "[]"
         else:
-            return None
+            handler = self.handler_factory.get_handler('string')
 
         return handler.transform(value)
 
-    def _process_children(self, children_data: List) -> List[str]:
-        """Process child widgets"""
+    def _handle_dict_prop(self, name: str, value: Dict) -> Optional[str]:
+        # Could be a widget or complex property
+        if 'type' in value:
+            return self._generate_subtree(value)
+        elif name == 'padding':
+            # Special case for padding
+            return self._edge_insets_handler.transform(value)
+        elif name == 'margin':
+            # Special case for margin
+            return self._edge_insets_handler.transform(value)
+        elif name == 'decoration':
+            # Special case for decoration
+            if not value or all(v is None for v in value.values()):
+                return "null"
+            return "BoxDecoration()"  # Basic decoration
+        else:
+            # For other dicts, return null instead of raw dict
+            return "null"
+
+    def _handle_list_prop(self, name: str, value: List) -> Optional[str]:
+        # Try to handle as a list
+        if value and isinstance(value[0], dict) and 'type' in value[0]:
+            # List of widgets
+            handler = self.handler_factory.get_handler('widget_list', widget_generator=self)
+            return handler.transform(value)
+
+        # Generic list - transform each item
+        items = []
+        for item in value:
+            item_dart = self._handle_unknown_property(f"{name}_item", item)
+            if item_dart:
+                items.append(item_dart)
+        return f"[{', '.join(items)}]" if items else "[]"
+
+    # Exact value type -> handler for _handle_unknown_property
+    _TYPE_DISPATCH = {
+        bool: _handle_bool_prop,
+        int: _handle_int_prop,
+        float: _handle_double_prop,
+        str: _handle_string_prop,
+        dict: _handle_dict_prop,
+        list: _handle_list_prop,
+    }
+
+    def _process_children(self, children_data: List) -> List:
+        """Collect child entries: widget dicts to generate, strings as direct references"""
 
         # Handle various input formats
         if not children_data:
@@ -449,87 +1205,42 @@ class DynamicWidgetGenerator:
         if not isinstance(children_data, list):
             return []
 
-        children = []
-        for child_data in children_data:
-            if isinstance(child_data, dict):
-                child_code = self.generate_widget(child_data)
-                children.append(child_code)
-            elif isinstance(child_data, str):
-                # Direct widget reference
-                children.append(child_data)
-
-        return children
+        return [child_data for child_data in children_data
+                if isinstance(child_data, (dict, str))]
 
-    def _render_template(self, template_string: str, widget_type, properties: List[Dict],
-                         children: Optional[List] = None) -> str:
+    def _render_template(self, template_string: Optional[str], widget_type, properties: List[ProcessedProp],
+                         children: Optional[List] = None,
+                         render_function: Optional[Callable] = None) -> str:
         """Render the template with context"""
-        import html
 
         try:
-            template = Template(template_string)
-            context = Context({
-                'widget_name': widget_type.dart_class_name,
-                'properties': properties,
-                'children': children or [],
-                'widget_type': widget_type,
-            })
-
-            rendered = template.render(context).strip()
-            # Check for raw Python dict syntax and replace with null
-            import re
-            # Pattern to match Python dict syntax like {'key': value}
-            dict_pattern = r"\{['\"][\w]+['\"]\s*:\s*[^}]+\}"
-            rendered = re.sub(dict_pattern, 'null', rendered)
-
-            # Also check for simple {'word': null} patterns
-            rendered = re.sub(r"\{['\"]?\w+['\"]?\s*:\s*null\}", 'null', rendered)
-
-            # Final safety check - decode any remaining HTML entities
-            for _ in range(5):
-                prev = rendered
-                rendered = html.unescape(rendered)
-                if rendered == prev:
-                    break
-
-            # Clean up extra commas and whitespace
-            import re
-            rendered = re.sub(r',(\s*[}\)])', r'\1', rendered)
-            rendered = re.sub(r'\n\s*\n', '\n', rendered)
-
-            return rendered
-
-        except Exception as e:
-            logger.error(f"Template rendering error: {str(e)}")
-            return self._generate_fallback_widget({'type': widget_type.name})
-
-    def _matches_conditions(self, conditions: Dict, component_data: Dict) -> bool:
-        """Check if component matches template conditions"""
-
-        if not conditions:
-            return True
+            if template_string is None:
+                # Default layout - no template at all
+                rendered = self._render_default(widget_type, properties, children).strip()
+            elif render_function is not None:
+                # Precompiled template - call it directly, no template engine
+                rendered = render_function(
+                    widget_type.dart_class_name,
+                    properties,
+                    children or [],
+                    widget_type
+                ).strip()
+            else:
+                template = _compile_template(template_string)
+                context = Context({
+                    'widget_name': widget_type.dart_class_name,
+                    'properties': properties,
+                    'children': children or [],
+                    'widget_type': widget_type,
+                }, autoescape=False)  # Dart code, not HTML - don't entity-encode quotes
 
-        for key, expected_value in conditions.items():
-            actual_value = component_data.get(key)
+                rendered = template.render(context).strip()
 
-            # Handle nested keys (e.g., "properties.color")
-            if '.' in key:
-                keys = key.split('.')
-                actual_value = component_data
-                for k in keys:
-                    if isinstance(actual_value, dict):
-                        actual_value = actual_value.get(k)
-                    else:
-                        actual_value = None
-                        break
-
-            # Check if values match
-            if isinstance(expected_value, list):
-                if actual_value not in expected_value:
-                    return False
-            elif actual_value != expected_value:
-                return False
+            return _clean_rendered(rendered)
 
-        return True
+        except (TemplateSyntaxError, TemplateDoesNotExist) as e:
+            logger.error(f"Template rendering error: {str(e)}")
+            return self._generate_fallback_widget({'type': widget_type.name})
 
     def _generate_fallback_widget(self, component_data: Dict) -> str:
         """Generate a fallback widget when type is not found"""
@@ -540,22 +1251,16 @@ class DynamicWidgetGenerator:
         # Generate simple property list
         prop_strings = []
         for key, value in props.items():
-            if isinstance(value, str):
-                prop_strings.append(f"{key}: '{value}'")
-            elif isinstance(value, bool):
-                prop_strings.append(f"{key}: {'true' if value else 'false'}")
-            elif isinstance(value, (int, float)):
-                prop_strings.append(f"{key}: {value}")
-
-        if prop_strings:
-            return f"{widget_type}({', '.join(prop_strings)})"
-        else:
-            return f"{widget_type}()"
+            formatter = _FALLBACK_FORMATTERS.get(type(value))
+            if formatter:
+                prop_strings.append(formatter(key, value))
+
+        return ''.join((str(widget_type), '(', ', '.join(prop_strings), ')'))
 
     def generate_imports(self, components: List[Dict]) -> List[str]:
         """Generate required import statements with CarouselSlider fix"""
-        imports = set()
-        imports.add("import 'package:flutter/material.dart';")
+        # Kept sorted as lines are inserted, so no final sort is needed
+        imports = ["import 'package:flutter/material.dart';"]
 
         # Check if carousel_slider is used
         uses_carousel = False
@@ -569,29 +1274,53 @@ class DynamicWidgetGenerator:
                 if widget_type_name == 'CarouselSlider':
                     uses_carousel = True
 
+        # Look up every uncached widget type in a single query
+        self._load_import_lines(widget_types)
+
         # Get imports for each widget type
-        from .models import WidgetType
         for widget_type_name in widget_types:
-            try:
-                widget_type = WidgetType.objects.get(name=widget_type_name)
+            import_line = self.import_cache[widget_type_name]
+            if import_line is None:
+                continue
 
-                # Add package import if needed
-                if widget_type.package:
-                    if widget_type.import_path:
-                        imports.add(f"import '{widget_type.import_path}';")
-                    else:
-                        package_name = widget_type.package.name
-                        # Special handling for carousel_slider to avoid conflicts
-                        if package_name == 'carousel_slider':
-                            # Import with hide to avoid CarouselController conflict
-                            imports.add(f"import 'package:{package_name}/{package_name}.dart';")
-                        else:
-                            imports.add(f"import 'package:{package_name}/{package_name}.dart';")
+            index = bisect.bisect_left(imports, import_line)
+            if index == len(imports) or imports[index] != import_line:
+                imports.insert(index, import_line)
+
+        return imports
 
-            except WidgetType.DoesNotExist:
-                pass
+    def _load_import_lines(self, widget_type_names):
+        """Fill import_cache for the given type names with one query for the missing ones"""
+        missing = [name for name in widget_type_names if name not in self.import_cache]
+        if not missing:
+            return
 
-        return sorted(list(imports))
+        widget_types = WidgetType.objects.filter(name__in=missing).select_related('package')
+        by_name = {widget_type.name: widget_type for widget_type in widget_types}
+
+        for widget_type_name in missing:
+            widget_type = by_name.get(widget_type_name)
+            self.import_cache[widget_type_name] = (
+                self._get_import_line(widget_type) if widget_type else None
+            )
+
+    def _get_import_line(self, widget_type) -> Optional[str]:
+        """Import statement needed for a widget type, if any"""
+
+        # Add package import if needed
+        if widget_type.package:
+            if widget_type.import_path:
+                return f"import '{widget_type.import_path}';"
+
+            package_name = widget_type.package.name
+            # Special handling for carousel_slider to avoid conflicts
+            if package_name == 'carousel_slider':
+                # Import with hide to avoid CarouselController conflict
+                return f"import 'package:{package_name}/{package_name}.dart';"
+            else:
+                return f"import 'package:{package_name}/{package_name}.dart';"
+
+        return None
 
     def validate_component(self, component_data: Dict) -> Dict[str, Any]:
         """Validate a component definition"""
@@ -609,7 +1338,6 @@ class DynamicWidgetGenerator:
             result['errors'].append("Widget type is required")
             return result
 
-        from .models import WidgetType
         try:
             widget_type = WidgetType.objects.get(name=widget_type_name)
         except WidgetType.DoesNotExist:
@@ -622,19 +1350,20 @@ class DynamicWidgetGenerator:
             if not props.get('data') and not props.get('text'):
                 result['warnings'].append("Text widget should have 'data' or 'text' property")
 
-        # Validate properties
+        # Validate properties - fetch the definitions once and filter in Python
         props = component_data.get('properties', {})
-        required_props = widget_type.properties.filter(is_required=True)
+        all_props = list(widget_type.properties.all())
+        required_props = [p for p in all_props if p.is_required]
 
         for prop_def in required_props:
             if prop_def.name not in props:
                 result['warnings'].append(f"Required property '{prop_def.name}' is missing")
 
         # Validate property values
-        for prop_def in widget_type.properties.all():
+        for prop_def in all_props:
             if prop_def.name in props:
                 value = props[prop_def.name]
-                handler = self.handler_factory.get_handler(prop_def.property_type)
+                handler = self._handler_for_prop.get(prop_def.pk) or self._resolve_handler_for_prop(prop_def)
 
                 if not handler.validate(value):
                     result['errors'].append(
@@ -644,28 +1373,9 @@ class DynamicWidgetGenerator:
 
         return result
 
-    def _decode_html_entities(self, value):
-        """Recursively decode HTML entities"""
-        import html
-        if isinstance(value, str):
-            decoded = value
-            for _ in range(3):
-                prev = decoded
-                decoded = html.unescape(decoded)
-                if decoded == prev:
-                    break
-            return decoded
-        elif isinstance(value, dict):
-            return {self._decode_html_entities(k): self._decode_html_entities(v)
-                    for k, v in value.items()}
-        elif isinstance(value, list):
-            return [self._decode_html_entities(item) for item in value]
-        else:
-            return value
-
     def _generate_icon_widget(self, component_data: Dict[str, Any]) -> str:
         """Special handling for Icon widget"""
-        props = self._decode_html_deeply(component_data.get('properties', {}))
+        props = component_data.get('properties', {})
 
         # Icon requires an icon data parameter
         icon_name = props.get('icon', 'Icons.info')
@@ -680,20 +1390,16 @@ class DynamicWidgetGenerator:
         if 'size' in props:
             parts.append(f"size: {props['size']}.0")
         if 'color' in props:
-            from .property_handlers import ColorPropertyHandler
-            color_handler = ColorPropertyHandler()
-            color = color_handler.transform(props['color'])
+            color = _color(props['color'])
             parts.append(f"color: {color}")
 
-        if len(parts) > 1:
-            return f"Icon({parts[0]}, {', '.join(parts[1:])})"
-        else:
-            return f"Icon({icon_name})"
+        return ''.join(('Icon(', ', '.join(parts), ')'))
 
     def _generate_button_widget(self, component_data: Dict[str, Any]) -> str:
         """Special handling for button widgets that require onPressed"""
         widget_type_name = component_data.get('type')
-        props = self._decode_html_deeply(component_data.get('properties', {}))
+        # Copy, since onPressed may be filled in below
+        props = dict(component_data.get('properties', {}))
 
         # Ensure onPressed is present
         if 'onPressed' not in props:
@@ -703,7 +1409,7 @@ class DynamicWidgetGenerator:
         if widget_type_name == 'IconButton':
             icon_props = props.get('icon', {})
             if isinstance(icon_props, dict):
-                icon_code = self.generate_widget(icon_props)
+                icon_code = self._generate_subtree(icon_props)
             else:
                 icon_code = "Icon(Icons.info)"
 
@@ -713,16 +1419,14 @@ class DynamicWidgetGenerator:
         elif widget_type_name == 'FloatingActionButton':
             child_props = props.get('child', {})
             if isinstance(child_props, dict):
-                child_code = self.generate_widget(child_props)
+                child_code = self._generate_subtree(child_props)
             else:
                 child_code = "Icon(Icons.add)"
 
             parts = [f"onPressed: {props['onPressed']}", f"child: {child_code}"]
 
             if 'backgroundColor' in props:
-                from .property_handlers import ColorPropertyHandler
-                color_handler = ColorPropertyHandler()
-                color = color_handler.transform(props['backgroundColor'])
+                color = _color(props['backgroundColor'])
                 parts.append(f"backgroundColor: {color}")
 
             return f"FloatingActionButton({', '.join(parts)})"
@@ -732,62 +1436,33 @@ class DynamicWidgetGenerator:
 
     def _generate_badge_widget(self, component_data: Dict[str, Any]) -> str:
         """Handle Badge widget - use badges package with alias to avoid conflict"""
-        props = self._decode_html_deeply(component_data.get('properties', {}))
+        props = component_data.get('properties', {})
 
         child_props = props.get('child', {})
-        if isinstance(child_props, dict):
-            child_code = self.generate_widget(child_props)
+        if type(child_props) is dict:
+            child_code = self._generate_subtree(child_props)
         else:
-            child_code = "Container()"
+            child_code = _DEFAULT_CHILD
 
         badge_content = props.get('badgeContent', {})
-        if isinstance(badge_content, dict):
-            badge_code = self.generate_widget(badge_content)
+        if type(badge_content) is dict:
+            badge_code = self._generate_subtree(badge_content)
         else:
-            badge_code = "Text('0')"
+            badge_code = _DEFAULT_BADGE
 
         badge_color = props.get('badgeColor', 'red')
-        from .property_handlers import ColorPropertyHandler
-        color_handler = ColorPropertyHandler()
-        color = color_handler.transform(badge_color)
+        color = _color(badge_color)
 
         # Use badges.Badge with prefix to avoid conflict with Flutter's Badge
-        return f"""badges.Badge(
-          badgeContent: {badge_code},
-          badgeStyle: badges.BadgeStyle(
-            badgeColor: {color},
-          ),
-          child: {child_code},
-        )"""
+        return _BADGE_PRE1 + badge_code + _BADGE_MID1 + color + _BADGE_MID2 + child_code + _BADGE_SUF
 
     def _validate_and_clean_output(self, code: str) -> str:
-        """Validate and clean generated widget code"""
-        import re
-
-        # Remove any "None" values
-        code = re.sub(r'\bNone\b', 'null', code)
-
-        # Remove any undefined prefixes (like badges. if package not available)
-        code = re.sub(r'\bbadges\.', '', code)
-
-        # Fix any remaining HTML entities
-        import html
-        for _ in range(3):
-            prev = code
-            code = html.unescape(code)
-            if code == prev:
-                break
-
-        # Remove invalid property assignments
-        code = re.sub(r',\s*,', ',', code)  # Remove double commas
-        code = re.sub(r',\s*\)', ')', code)  # Remove trailing commas before )
-        code = re.sub(r',\s*\]', ']', code)  # Remove trailing commas before ]
-
-        return code
+        """Validate and clean generated widget code (see make_cleaner)"""
+        return self._cleaner(code)
 
     def _generate_speed_dial_widget(self, component_data: Dict[str, Any]) -> str:
         """Handle SpeedDial widget"""
-        props = self._decode_html_deeply(component_data.get('properties', {}))
+        props = component_data.get('properties', {})
 
         # Process children
         children_data = props.get('children', [])
@@ -820,9 +1495,7 @@ class DynamicWidgetGenerator:
             parts.append(f"activeIcon: {active_icon}")
 
         if 'backgroundColor' in props:
-            from .property_handlers import ColorPropertyHandler
-            color_handler = ColorPropertyHandler()
-            color = color_handler.transform(props['backgroundColor'])
+            color = _color(props['backgroundColor'])
             parts.append(f"backgroundColor: {color}")
 
         # Add children if any, otherwise empty list